@@ -1,50 +1,39 @@
+import argparse
 import math
-import random
-from typing import List, Tuple
+import os
+import warnings
+from multiprocessing import Pool
+from typing import Optional, Tuple
 
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
+import numpy as np
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
 
-Point = Tuple[float, float]
+Points = Tuple[np.ndarray, np.ndarray]
 
 # Function To Generate Random Points
-def generate_points(n_points : int, case : str) -> List[Point]:
-    points : list[Point] = []
+def generate_points(n_points : int, case : str, rng : np.random.Generator) -> Points:
     if case == "rejection_sampling":
-        while len(points) < n_points:
-            x = random.uniform(-1, 1)
-            y = random.uniform(-1, 1)
-            if x**2 + y**2 <= 1:
-                points.append((x, y))
+        # Acceptance Rate Is pi / 4, So Oversample With A 5-Sigma Margin And Redraw Only On Shortfall
+        xy = np.empty((0, 2))
+        while len(xy) < n_points:
+            missing = n_points - len(xy)
+            n_candidates = math.ceil(missing * 4 / math.pi) + 5 * math.isqrt(missing) + 16
+            candidates = rng.uniform(-1, 1, (n_candidates, 2))
+            xy = np.concatenate((xy, candidates[(candidates * candidates).sum(axis = 1) <= 1]))
+        return xy[:n_points, 0], xy[:n_points, 1]
     elif case == "polar_coordinates":
-        while len(points) < n_points:
-            r = random.uniform(0, 1)
-            theta = random.uniform(0, 2 * math.pi)
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            points.append((x, y))
+        r = rng.random(n_points)
     elif case == "inverse_tansform_sampling":
-        while len(points) < n_points:
-            r = math.sqrt(random.uniform(0, 1))
-            theta = random.uniform(0, 2 * math.pi)
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            points.append((x, y))
+        r = np.sqrt(rng.random(n_points))
     elif case == "infinite_triangle":
-        while len(points) < n_points:
-            a = random.uniform(0, 1)
-            b = random.uniform(0, 1)
-            theta = random.uniform(0, 2 * math.pi)
+        # Fold a + b Back Into [0, 1]: r > 1 Maps To 2 - r
+        r = 1 - np.abs(rng.random((2, n_points)).sum(axis = 0) - 1)
+    else:
+        return np.empty(0), np.empty(0)
 
-            r = a + b
-            if r > 1:
-                r = 2 - r
-
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            points.append((x, y))
-
-    return points
+    theta = rng.random(n_points) * 2 * math.pi
+    return r * np.cos(theta), r * np.sin(theta)
 
 def beautify_plot(fig : plt.Figure, ax : plt.Axes) -> None:
     ax.set_aspect("equal")
@@ -66,7 +55,7 @@ def beautify_plot(fig : plt.Figure, ax : plt.Axes) -> None:
     square = plt.Rectangle((-1, -1), 2, 2, edgecolor="#f44336", facecolor="none", linewidth = 1.5)
     ax.add_patch(square)
 
-def create_animation(case : str, duration : int, fps : int, num_points : int = 1000, type : str = "gif") -> None:
+def create_animation(case : str, duration : int, fps : int, num_points : int = 1000, type : str = "gif", seed : Optional[int] = None) -> None:
     # Plot Setup
     fig, ax = plt.subplots()
     beautify_plot(fig, ax)
@@ -74,46 +63,67 @@ def create_animation(case : str, duration : int, fps : int, num_points : int = 1
     (points,) = ax.plot([], [], "o", markersize = 0.8, color = "#8bc34a")
     text = ax.text(1.0, 1.05, '', color = "white", transform = ax.transAxes, ha = "right")
 
-    points_list : List[Point] = []
+    total_frames : int = duration * fps
+    pts_to_generate : int = num_points // total_frames
+    xs : np.ndarray = np.empty(pts_to_generate * total_frames)
+    ys : np.ndarray = np.empty(pts_to_generate * total_frames)
+    cursor : int = 0
+    rng = np.random.default_rng(seed)
+    text_every : int = max(1, fps // 2)
 
     # Animation Initialization
     def init() -> Tuple[plt.Line2D]:
-        points_list.clear()
-        points.set_data([], [])
+        nonlocal cursor
+        cursor = 0
+        points.set_data(xs[:cursor], ys[:cursor])
         text.set_text('')
         return points, text
 
     # Animation Updation
     def update(frame : int) -> Tuple[plt.Line2D]:
-        pts_to_generate = num_points // (duration * fps)
-        new_points = generate_points(pts_to_generate, case)
-        points_list.extend(new_points)
-        points.set_data(
-            [point[0] for point in points_list], [point[1] for point in points_list]
-        )
-        text.set_text(f'Points: {len(points_list)}')
+        nonlocal cursor
+        new_xs, new_ys = generate_points(pts_to_generate, case, rng)
+        # Unknown Cases Generate No Points, So Advance By What Was Actually Returned
+        xs[cursor:cursor + len(new_xs)] = new_xs
+        ys[cursor:cursor + len(new_ys)] = new_ys
+        cursor += len(new_xs)
+        points.set_data(xs[:cursor], ys[:cursor])
+        if frame % text_every == 0 or frame == total_frames - 1:
+            text.set_text(f'Points: {cursor}')
         return points, text
 
     # Animation Generation
-    total_frames : int = duration * fps
     ani = FuncAnimation(fig, update, frames=range(total_frames), init_func=init, blit=True)
 
     # Animation Saving
-    writer = PillowWriter(fps=fps)
+    if type == "mp4":
+        writer = FFMpegWriter(fps=fps, bitrate=2400)
+    else:
+        writer = PillowWriter(fps=fps)
     ani.save(f'{case}.{type}', writer=writer)
 
     plt.close(fig)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--format", choices = ["mp4", "gif"], default = "mp4")
+    args = parser.parse_args()
+
+    if args.format == "mp4" and not FFMpegWriter.isAvailable():
+        warnings.warn("ffmpeg not found, falling back to gif output")
+        args.format = "gif"
+
     duration = 10
     fps = 15
     num_points = 3000
 
     animation_types = ["rejection_sampling", "polar_coordinates", "inverse_tansform_sampling", "infinite_triangle"]
 
+    with Pool(min(len(animation_types), os.cpu_count() or 1)) as pool:
+        pool.starmap(create_animation, [(case, duration, fps, num_points, args.format) for case in animation_types])
+
     for case in animation_types:
-        create_animation(case, duration, fps, num_points, "gif")
-        print(f"Animation for {case} created successfully & Saved as {case}.gif !")
+        print(f"Animation for {case} created successfully & Saved as {case}.{args.format} !")
 
     create_animation("init", duration, fps, 0, "png")